@@ -1,9 +1,32 @@
-import numpy as np
+from bisect import bisect_right
 
 # ------------------------------------------------------------
 # Biological Age Estimation
 # ------------------------------------------------------------
 
+# BMI bands: <18.5, 18.5–25, 25–30, 30+ (ideal BMI around 22–24, U-shaped penalty)
+_BMI_THRESHOLDS = (18.5, 25.0, 30.0)
+_BMI_PENALTY = (2, -2, 2, 5)
+
+# Activity level → years added to biological age (unknown levels: 0)
+_ACTIVITY_DELTA = {
+    "athlete": -5,
+    "moderately active": -2,
+    "mildly active": -1,
+    "sedentary": 3,
+}
+
+# Health condition → years added to biological age
+_CONDITION_PENALTY = {
+    "hypertension": 3,
+    "diabetes": 4,
+    "smoker": 5,
+    "obesity": 4,
+    "heart-disease": 6,
+    "anxiety-depression": 2,
+}
+
+
 def estimate_biological_age(
     chronological_age: float,
     height_cm: float,
@@ -15,66 +38,84 @@ def estimate_biological_age(
     """
     Estimate biological age using simple physiologic predictors.
     Lower is better.
+
+    activity_level and conditions are matched case-insensitively.
+    Recognised activity levels: "sedentary", "mildly active",
+    "moderately active", "athlete".
+    Recognised conditions: "hypertension", "diabetes", "smoker", "obesity",
+    "heart-disease", "anxiety-depression".
+    Anything else adds no years.
     """
 
-    bio_age = float(chronological_age)
+    # Every adjustment is a whole number of years, so accumulate them as an
+    # int and only convert to float once at the end
+    years = 0
 
     # BMI effect (U-shaped penalty)
     height_m = height_cm / 100
     bmi = weight_kg / (height_m ** 2)
 
-    # Ideal BMI around 22–24
-    if bmi < 18.5:
-        bio_age += 2
-    elif bmi < 25:
-        bio_age -= 2
-    elif bmi < 30:
-        bio_age += 2
-    else:
-        bio_age += 5
+    years += _BMI_PENALTY[bisect_right(_BMI_THRESHOLDS, bmi)]
 
     # Resting heart rate (RHR)
     if resting_hr < 60:
-        bio_age -= 3
-    elif resting_hr <= 75:
-        bio_age += 0
-    else:
-        bio_age += 4
+        years -= 3
+    elif resting_hr > 75:
+        years += 4
 
     # Activity level
-    level = activity_level.lower().strip()
-    if level == "athlete":
-        bio_age -= 5
-    elif level == "moderately active":
-        bio_age -= 2
-    elif level == "mildly active":
-        bio_age -= 1
-    elif level == "sedentary":
-        bio_age += 3
+    years += _ACTIVITY_DELTA.get(activity_level.lower().strip(), 0)
 
     # Health conditions penalty
-    condition_penalty = {
-        "hypertension": 3,
-        "diabetes": 4,
-        "smoker": 5,
-        "obesity": 4,
-        "heart-disease": 6,
-         "anxiety-depression": 2,
-    }
-
-    for c in conditions:
-        c_norm = c.lower().strip()
-        if c_norm in condition_penalty:
-            bio_age += condition_penalty[c_norm]
+    years += sum(_CONDITION_PENALTY.get(c.lower().strip(), 0) for c in conditions)
+
+    bio_age = chronological_age + years
 
     # Bounds
-    return float(np.clip(bio_age, 18, 100))
+    return float(min(max(bio_age, 18), 100))
 
 
 # ------------------------------------------------------------
 # Financial Age Estimation 
 # ------------------------------------------------------------
 
+# Median net worth by age (US + Canada blended reference curve)
+_AGE_POINTS = (25.0, 30.0, 35.0, 40.0, 45.0, 50.0, 55.0, 60.0, 65.0, 70.0)
+_NETWORTH_POINTS = (
+    20000.0,     # age 25
+    60000.0,     # age 30
+    120000.0,    # age 35
+    200000.0,    # age 40
+    300000.0,    # age 45
+    450000.0,    # age 50
+    650000.0,    # age 55
+    850000.0,    # age 60
+    1000000.0,   # age 65
+    1100000.0,   # age 70
+)
+
+# Slope of each curve segment, so interpolation is one multiply + add
+_AGE_SLOPES = tuple(
+    (_AGE_POINTS[i] - _AGE_POINTS[i - 1]) / (_NETWORTH_POINTS[i] - _NETWORTH_POINTS[i - 1])
+    for i in range(1, len(_NETWORTH_POINTS))
+)
+
+
+def _interp_scalar(x: float, xp: tuple, fp: tuple, slopes: tuple) -> float:
+    """
+    Piecewise-linear interpolation of a single value, clamped to the endpoints.
+    Same result as np.interp for scalars, without the NumPy dispatch.
+    """
+    if x != x:
+        return x  # NaN passes through, as with np.interp
+    if x <= xp[0]:
+        return fp[0]
+    if x >= xp[-1]:
+        return fp[-1]
+    i = bisect_right(xp, x)
+    return fp[i - 1] + slopes[i - 1] * (x - xp[i - 1])
+
+
 def estimate_financial_age(net_worth: float, housing_status: str) -> float:
     """
     Estimate financial age by interpolating against a realistic median net-worth curve.
@@ -84,28 +125,11 @@ def estimate_financial_age(net_worth: float, housing_status: str) -> float:
     home ownership increase it slightly (boost).
     """
 
-    # Median net worth by age (US + Canada blended reference curve)
-    age_points = np.array([25, 30, 35, 40, 45, 50, 55, 60, 65, 70], dtype=float)
-    networth_points = np.array([
-        20000,     # age 25
-        60000,     # age 30
-        120000,    # age 35
-        200000,    # age 40
-        300000,    # age 45
-        450000,    # age 50
-        650000,    # age 55
-        850000,    # age 60
-        1000000,   # age 65
-        1100000    # age 70
-    ], dtype=float)
-
     nw = float(net_worth)
 
-    # Clamp net worth to realistic boundaries of the curve
-    nw_clamped = np.clip(nw, networth_points.min(), networth_points.max())
-
     # Linear interpolation: net worth → implied financial age
-    financial_age = np.interp(nw_clamped, networth_points, age_points)
+    # (clamped to the curve endpoints, so no explicit clip is needed)
+    financial_age = _interp_scalar(nw, _NETWORTH_POINTS, _AGE_POINTS, _AGE_SLOPES)
 
     # Housing adjustment (small, realistic)
     hs = housing_status.lower().strip()
@@ -115,7 +139,7 @@ def estimate_financial_age(net_worth: float, housing_status: str) -> float:
         financial_age -= 3       # renting delays typical wealth accumulation
 
     # Reasonable output bounds
-    return float(np.clip(financial_age, 18, 95))
+    return float(min(max(financial_age, 18), 95))
 
 
 # ------------------------------------------------------------
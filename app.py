@@ -1,5 +1,4 @@
 import streamlit as st
-import numpy as np
 from algorithms import (
     estimate_biological_age,
     estimate_financial_age,
@@ -10,28 +9,23 @@ from algorithms import (
 # ------------------------------------------------------------
 # Helper: Arrow rendering
 # ------------------------------------------------------------
+# (is_bio, sign of delta) → (arrow, color)
+_ARROWS = {
+    (True, -1): ("↓", "green"),
+    (True, 0): ("→", "gray"),
+    (True, 1): ("↑", "red"),
+    (False, -1): ("↓", "red"),
+    (False, 0): ("→", "gray"),
+    (False, 1): ("↑", "green"),
+}
+
+
 def render_arrow(delta: float, is_bio: bool = False):
     """
     Biological age: lower is better → green for negative delta.
     Financial age: higher is better → green for positive delta.
     """
-
-    if is_bio:
-        # Bio age: negative delta is good
-        if delta < 0:
-            return "↓", "green"
-        elif delta > 0:
-            return "↑", "red"
-        else:
-            return "→", "gray"
-    else:
-        # Financial age: positive delta is good
-        if delta > 0:
-            return "↑", "green"
-        elif delta < 0:
-            return "↓", "red"
-        else:
-            return "→", "gray"
+    return _ARROWS[(is_bio, (delta > 0) - (delta < 0))]
 
 
 # ------------------------------------------------------------
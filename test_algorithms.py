@@ -0,0 +1,71 @@
+import math
+
+import pytest
+
+from algorithms import estimate_biological_age, estimate_financial_age
+
+
+# ------------------------------------------------------------
+# Biological Age: band boundaries
+# ------------------------------------------------------------
+# At 200 cm, BMI = weight_kg / 4, so the BMI cut-offs land on whole weights.
+
+@pytest.mark.parametrize(
+    "weight_kg, expected",
+    [
+        (73, 42.0),    # BMI 18.25 → +2
+        (74, 38.0),    # BMI 18.5  → -2
+        (100, 42.0),   # BMI 25.0  → +2
+        (120, 45.0),   # BMI 30.0  → +5
+    ],
+)
+def test_bmi_boundaries(weight_kg, expected):
+    assert estimate_biological_age(40, 200, weight_kg, 65, "", []) == expected
+
+
+@pytest.mark.parametrize(
+    "resting_hr, expected",
+    [
+        (59, 35.0),    # → -3
+        (60, 38.0),    # → 0
+        (75, 38.0),    # → 0
+        (75.5, 42.0),  # → +4
+    ],
+)
+def test_rhr_boundaries(resting_hr, expected):
+    # BMI 22.5 → -2
+    assert estimate_biological_age(40, 200, 90, resting_hr, "", []) == expected
+
+
+def test_conditions_and_activity_are_case_insensitive():
+    assert estimate_biological_age(
+        40, 200, 90, 65, " Sedentary", ["Hypertension", " smoker"]
+    ) == 49.0
+
+
+# ------------------------------------------------------------
+# Financial Age: housing and curve endpoints
+# ------------------------------------------------------------
+
+def test_housing_adjustment():
+    # 200000 sits exactly on the age-40 knot
+    assert estimate_financial_age(200000, "Own") == 43.0
+    assert estimate_financial_age(200000, "Rent") == 37.0
+
+
+@pytest.mark.parametrize(
+    "net_worth, expected",
+    [
+        (-50000, 28.0),
+        (0, 28.0),
+        (20000, 28.0),
+        (1100000, 73.0),
+        (5000000, 73.0),
+    ],
+)
+def test_net_worth_clamped_to_curve(net_worth, expected):
+    assert estimate_financial_age(net_worth, "Own") == expected
+
+
+def test_nan_net_worth_propagates():
+    assert math.isnan(estimate_financial_age(float("nan"), "Own"))